@@ -3,20 +3,94 @@ Compiler Manager - Backend for handling code compilation and execution
 across multiple programming languages
 """
 
+import asyncio
 import subprocess
+import codecs
+import hashlib
+import json
+import mmap
+import multiprocessing
 import os
+import re
+import selectors
+import signal
 import sys
 import tempfile
-import threading
 import time
+from concurrent.futures import (ProcessPoolExecutor, ThreadPoolExecutor,
+                                TimeoutError as FutureTimeoutError)
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 
+# Lazily constructed CompilerManager for batch-compile worker processes
+_BATCH_MANAGER = None
+
+
+def _compile_one_static(job):
+    """Compile one (file_path, language) job in a worker process
+
+    Module-level so it is picklable for ProcessPoolExecutor; the manager
+    is constructed once per worker and reused across jobs.
+    """
+    global _BATCH_MANAGER
+    if _BATCH_MANAGER is None:
+        _BATCH_MANAGER = CompilerManager()
+    file_path, language = job
+    return _BATCH_MANAGER.compile_code(file_path, language, None)
+
+
+def _run_script_child(path, conn):
+    """Execute a Python script in a forked worker and report its output
+
+    Runs in a child forked from the warm forkserver template, so it skips
+    full interpreter startup (site/encodings imports) that a fresh
+    `python script.py` subprocess would pay.
+    """
+    import io
+    import contextlib
+    import traceback
+
+    out = io.StringIO()
+    err = io.StringIO()
+    returncode = 0
+
+    try:
+        # Own session/process group, so a timeout in the parent can
+        # killpg this worker together with anything the script spawned
+        os.setsid()
+    except OSError:
+        pass
+
+    try:
+        os.chdir(os.path.dirname(path) or '.')
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            exec(compile(source, path, 'exec'),
+                 {'__name__': '__main__', '__file__': path})
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            returncode = e.code
+        elif e.code is not None:
+            print(e.code, file=err)
+            returncode = 1
+    except BaseException:
+        traceback.print_exc(file=err)
+        returncode = 1
+
+    conn.send((returncode, out.getvalue(), err.getvalue()))
+    conn.close()
+
+
 class CompilerManager:
     """Manages compilation and execution of code in multiple languages"""
 
-    def __init__(self):
+    # Matches a real input() call, not identifiers like my_input( or an
+    # input( that sits directly inside quotes
+    _INPUT_CALL_RE = re.compile(rb'(?<![\w"\'])input\s*\(')
+
+    def __init__(self, use_warm_worker=None):
         self.supported_languages = {
             'python': {
                 'extension': '.py',
@@ -50,38 +124,101 @@ class CompilerManager:
             }
         }
 
+        # Pre-tokenized run-command templates: (part, has_file_slot) pairs
+        # so each run formats the command with one list comprehension
+        # instead of copying the list and rewriting it in a loop
+        self._run_templates = {
+            lang: [(part, '{file}' in part) for part in (cfg['run_cmd'] or [])]
+            for lang, cfg in self.supported_languages.items()
+        }
+
+        # Persistent pool for draining subprocess stdout/stderr streams,
+        # so each run doesn't pay thread-creation cost for two fresh threads
+        self._reader_pool = ThreadPoolExecutor(max_workers=8)
+
+        # Warm forkserver template for running user Python scripts: each
+        # run forks from an already-initialized interpreter instead of
+        # spawning `python script.py` from scratch. Strictly opt-in
+        # (constructor flag, or UMLC_WARM_WORKER=1 in the environment):
+        # every forkserver child re-imports the host process's __main__
+        # module as part of multiprocessing's spawn fixup, which is only
+        # safe when the host guards its module-level code behind
+        # `if __name__ == "__main__"` - a contract this library must not
+        # impose on embedders silently. Unavailable on platforms without
+        # forkserver support (e.g. Windows).
+        if use_warm_worker is None:
+            use_warm_worker = os.environ.get('UMLC_WARM_WORKER') == '1'
+        self._mp_ctx = None
+        if use_warm_worker:
+            try:
+                self._mp_ctx = multiprocessing.get_context('forkserver')
+                self._mp_ctx.set_forkserver_preload(['os', 'sys', 'io'])
+            except ValueError:
+                pass
+
         # Check if required compilers/interpreters are available
         self._check_dependencies()
 
-    def _check_dependencies(self):
-        """Check if required compilers and interpreters are available"""
-        missing_deps = []
+    def close(self):
+        """Shut down background resources"""
+        self._reader_pool.shutdown(wait=False)
 
-        # Check Python (should always be available)
+    def __del__(self):
         try:
-            subprocess.run([sys.executable, '--version'],
-                         capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            missing_deps.append('python')
-
-        # Check Node.js for JavaScript
-        if not self._check_command(['node', '--version']):
-            missing_deps.append('node.js')
+            self.close()
+        except Exception:
+            pass
+
+    # Commands probed by _check_dependencies, keyed by display name
+    _DEPENDENCY_PROBES = {
+        'python': [sys.executable, '--version'],
+        'node.js': ['node', '--version'],
+        'gcc': ['gcc', '--version'],
+        'g++': ['g++', '--version'],
+        'javac': ['javac', '-version'],
+        'java': ['java', '-version'],
+    }
+
+    # How long cached dependency-check results stay valid (1 day)
+    _DEPENDENCY_CACHE_TTL = 24 * 60 * 60
+
+    def _dependency_cache_file(self) -> Path:
+        """Get the path of the dependency-check cache file for this PATH"""
+        key = hashlib.sha1(os.environ.get('PATH', '').encode()).hexdigest()
+        return Path(tempfile.gettempdir()) / f"umlc_deps_{key}.json"
 
-        # Check GCC for C/C++
-        if not self._check_command(['gcc', '--version']):
-            missing_deps.append('gcc')
-
-        # Check G++ for C++
-        if not self._check_command(['g++', '--version']):
-            missing_deps.append('g++')
+    def _check_dependencies(self):
+        """Check if required compilers and interpreters are available"""
+        # Reuse cached probe results when PATH hasn't changed recently,
+        # avoiding six subprocess spawns on every construction
+        cache_file = self._dependency_cache_file()
+        results = None
+        try:
+            if (cache_file.is_file() and
+                    time.time() - cache_file.stat().st_mtime < self._DEPENDENCY_CACHE_TTL):
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    cached = json.load(f)
+                if set(cached) == set(self._DEPENDENCY_PROBES):
+                    results = cached
+        except (OSError, ValueError):
+            results = None
+
+        if results is None:
+            # Probe all commands concurrently so total wall time is
+            # max(probe) instead of the sum of six sequential spawns
+            names = list(self._DEPENDENCY_PROBES)
+            with ThreadPoolExecutor(max_workers=len(names)) as pool:
+                available = pool.map(self._check_command,
+                                     self._DEPENDENCY_PROBES.values())
+            results = dict(zip(names, available))
 
-        # Check Java compiler and runtime
-        if not self._check_command(['javac', '-version']):
-            missing_deps.append('javac')
+            try:
+                with open(cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(results, f)
+            except OSError:
+                pass  # Cache is best-effort only
 
-        if not self._check_command(['java', '-version']):
-            missing_deps.append('java')
+        missing_deps = [name for name, ok in results.items() if not ok]
 
         if missing_deps:
             print(f"Warning: Missing dependencies: {', '.join(missing_deps)}")
@@ -90,7 +227,9 @@ class CompilerManager:
     def _check_command(self, cmd):
         """Check if a command is available"""
         try:
-            subprocess.run(cmd, capture_output=True, check=True)
+            # close_fds=False keeps the posix_spawn fast path and skips
+            # the per-spawn fd-table scan; we only pass the stdio pipes
+            subprocess.run(cmd, capture_output=True, check=True, close_fds=False)
             return True
         except (subprocess.CalledProcessError, FileNotFoundError):
             return False
@@ -149,50 +288,151 @@ class CompilerManager:
                 'error': f'Execution failed: {str(e)}'
             }
 
+    def spawn(self, file_path: str, language: str):
+        """Spawn a run as a binary-mode Popen for caller-driven streaming
+
+        Compiles first when the language needs it, then starts the child
+        with block-buffered binary pipes so the caller can pump
+        stdout/stderr itself (e.g. via OutputDisplay.attach_stream)
+        instead of going through the synchronous run path. Returns None
+        if the language is unsupported or compilation fails.
+        """
+        if language not in self.supported_languages:
+            return None
+
+        file_path = Path(file_path)
+
+        if language == 'java':
+            compile_result = self._compile_java(str(file_path), None)
+            if not compile_result['success']:
+                return None
+            run_cmd = ['java', file_path.stem]
+            working_dir = Path(compile_result['temp_dir'])
+        elif language in ('c', 'cpp'):
+            compile_result = self._compile_compiled(str(file_path), language, None)
+            if not compile_result['success']:
+                return None
+            executable = compile_result['executable']
+            run_cmd = [executable]
+            working_dir = Path(executable).parent
+        else:
+            run_cmd = [
+                part.replace('{file}', str(file_path)) if has_file else part
+                for part, has_file in self._run_templates[language]
+            ]
+            working_dir = file_path.parent
+
+        return subprocess.Popen(
+            run_cmd,
+            cwd=str(working_dir),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=-1,  # Block-buffered binary pipes, no text layer
+            close_fds=False,  # Keep the posix_spawn fast path
+            start_new_session=True  # Own process group for clean kill
+        )
+
+    def compile_batch(self, jobs) -> list:
+        """Compile several (file_path, language) jobs across CPU cores
+
+        Compiler processes are CPU-bound and independent, so batch
+        operations (e.g. compiling a directory of examples) fan out to a
+        bounded process pool instead of running serially.
+        """
+        if not jobs:
+            return []
+
+        max_workers = min(len(jobs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_compile_one_static, jobs))
+
+    async def compile_code_async(self, file_path: str, language: str,
+                                 output_display) -> Dict[str, Any]:
+        """Compile code without blocking the caller's event loop"""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.compile_code, file_path, language, output_display
+        )
+
+    async def run_code_async(self, file_path: str, language: str,
+                             output_display) -> Dict[str, Any]:
+        """Run code without blocking the caller's event loop"""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.run_code, file_path, language, output_display
+        )
+
+    def _fast_tempdir(self) -> Optional[str]:
+        """Get a RAM-backed directory for temp files, if one is available"""
+        if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+            return '/dev/shm'
+        return None  # tempfile falls back to the platform default
+
+    def _artifact_cache_dir(self, file_path: Path, language: str) -> Path:
+        """Get the artifact cache directory for this exact source content"""
+        digest = hashlib.sha256(file_path.read_bytes()).hexdigest()
+        return Path.home() / '.cache' / 'umlc' / language / digest
+
     def _compile_java(self, file_path: str, output_display) -> Dict[str, Any]:
         """Compile Java code"""
-        file_path = Path(file_path)
+        # Resolve to an absolute path: javac runs with the cache
+        # directory as its working directory
+        file_path = Path(file_path).resolve()
         file_name = file_path.stem
 
-        # Create a temporary directory for Java compilation
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_dir_path = Path(temp_dir)
+        # Reuse previously compiled classes for byte-identical source -
+        # repeated Run clicks without edits skip the javac spawn entirely
+        cache_dir = self._artifact_cache_dir(file_path, 'java')
+        class_file = cache_dir / f"{file_name}.class"
+        if class_file.exists():
+            if output_display:
+                output_display.show_info(f"Java compilation cached: {file_name}.class")
+            return {
+                'success': True,
+                'compiled_files': [str(class_file)],
+                'temp_dir': str(cache_dir)
+            }
 
-            # Copy the Java file to the temp directory
-            import shutil
-            java_file = temp_dir_path / file_path.name
-            shutil.copy2(file_path, java_file)
+        cache_dir.mkdir(parents=True, exist_ok=True)
 
-            # Compile the Java file
-            compile_cmd = ['javac', str(java_file)]
-            result = self._execute_command(compile_cmd, temp_dir_path, output_display)
+        # Copy the Java file into the cache directory
+        import shutil
+        java_file = cache_dir / file_path.name
+        shutil.copy2(file_path, java_file)
+
+        # Compile the Java file
+        compile_cmd = ['javac', str(java_file)]
+        result = self._execute_command(compile_cmd, cache_dir, output_display)
 
-            if result['success']:
+        if result['success']:
+            if output_display:
                 output_display.show_info(f"Java compilation successful: {file_name}.class")
-                return {
-                    'success': True,
-                    'compiled_files': [str(temp_dir_path / f"{file_name}.class")],
-                    'temp_dir': str(temp_dir_path)
-                }
-            else:
-                return result
+            return {
+                'success': True,
+                'compiled_files': [str(class_file)],
+                'temp_dir': str(cache_dir)
+            }
+        else:
+            return result
 
     def _run_java(self, file_path: str, output_display) -> Dict[str, Any]:
         """Run Java code"""
         file_path = Path(file_path)
         file_name = file_path.stem
 
-        # Create a temporary directory for Java execution
-        with tempfile.TemporaryDirectory() as temp_dir:
+        # Create a temporary directory for Java compilation and execution,
+        # preferring tmpfs so intermediate artifacts never touch disk
+        with tempfile.TemporaryDirectory(dir=self._fast_tempdir()) as temp_dir:
             temp_dir_path = Path(temp_dir)
 
-            # Copy the Java file and compiled class files to the temp directory
+            # Copy the Java file to the temp directory once and compile it
+            # in place, so the .class file lands next to where we run it
+            # (going through _compile_java would copy and compile again in
+            # a second temp directory)
             import shutil
             java_file = temp_dir_path / file_path.name
             shutil.copy2(file_path, java_file)
 
-            # Compile first
-            compile_result = self._compile_java(str(java_file), output_display)
+            compile_cmd = ['javac', str(java_file)]
+            compile_result = self._execute_command(compile_cmd, temp_dir_path, output_display)
             if not compile_result['success']:
                 return compile_result
 
@@ -202,31 +442,46 @@ class CompilerManager:
 
     def _compile_compiled(self, file_path: str, language: str, output_display) -> Dict[str, Any]:
         """Compile C/C++ code"""
-        file_path = Path(file_path)
+        # Resolve to an absolute path: the compiler runs with the cache
+        # directory as its working directory
+        file_path = Path(file_path).resolve()
         output_name = file_path.stem
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_dir_path = Path(temp_dir)
+        # Reuse a previously built executable for byte-identical source -
+        # repeated Run clicks without edits skip the gcc/g++ spawn entirely
+        cache_dir = self._artifact_cache_dir(file_path, language)
+        executable = cache_dir / output_name
+        if executable.exists():
+            if output_display:
+                output_display.show_info(f"{language.upper()} compilation cached: {output_name}")
+            return {
+                'success': True,
+                'executable': str(executable),
+                'temp_dir': str(cache_dir)
+            }
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
 
-            # Prepare compile command
-            compile_cmd = self.supported_languages[language]['compile_cmd'].copy()
-            for i, part in enumerate(compile_cmd):
-                if '{file}' in part:
-                    compile_cmd[i] = part.replace('{file}', str(file_path))
-                elif '{output}' in part:
-                    compile_cmd[i] = part.replace('{output}', str(temp_dir_path / output_name))
+        # Prepare compile command
+        compile_cmd = self.supported_languages[language]['compile_cmd'].copy()
+        for i, part in enumerate(compile_cmd):
+            if '{file}' in part:
+                compile_cmd[i] = part.replace('{file}', str(file_path))
+            elif '{output}' in part:
+                compile_cmd[i] = part.replace('{output}', str(executable))
 
-            result = self._execute_command(compile_cmd, temp_dir_path, output_display)
+        result = self._execute_command(compile_cmd, cache_dir, output_display)
 
-            if result['success']:
+        if result['success']:
+            if output_display:
                 output_display.show_info(f"{language.upper()} compilation successful: {output_name}")
-                return {
-                    'success': True,
-                    'executable': str(temp_dir_path / output_name),
-                    'temp_dir': str(temp_dir_path)
-                }
-            else:
-                return result
+            return {
+                'success': True,
+                'executable': str(executable),
+                'temp_dir': str(cache_dir)
+            }
+        else:
+            return result
 
     def _run_compiled(self, file_path: str, language: str, output_display) -> Dict[str, Any]:
         """Run compiled C/C++ code"""
@@ -250,11 +505,11 @@ class CompilerManager:
         if language == 'python':
             return self._run_python_interactive(file_path, output_display)
 
-        # Prepare run command
-        run_cmd = self.supported_languages[language]['run_cmd'].copy()
-        for i, part in enumerate(run_cmd):
-            if '{file}' in part:
-                run_cmd[i] = part.replace('{file}', str(file_path))
+        # Prepare run command from the pre-tokenized template
+        run_cmd = [
+            part.replace('{file}', str(file_path)) if has_file else part
+            for part, has_file in self._run_templates[language]
+        ]
 
         return self._execute_command(run_cmd, file_path.parent, output_display)
 
@@ -262,25 +517,34 @@ class CompilerManager:
         """Run Python code with special handling for input() functions"""
         file_path = Path(file_path)
 
-        # Read the file content to check for input() usage
+        # Scan for input() calls without materializing the file contents:
+        # mmap the file and search it with the compiled regex, which stops
+        # at the first hit and needs O(1) memory regardless of file size
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with open(file_path, 'rb') as f:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        has_input = bool(self._INPUT_CALL_RE.search(mm))
+                except ValueError:
+                    has_input = False  # Empty file can't be mapped
         except Exception as e:
             return {
                 'success': False,
                 'error': f'Failed to read file: {str(e)}'
             }
 
-        # Check if the code contains input() calls
-        has_input = 'input(' in content
-
         if has_input:
             # For interactive programs, we'll run with a timeout and provide empty input
             if output_display:
                 output_display.show_warning("Program contains input() - providing empty input for non-interactive execution")
             else:
                 print("Warning: Program contains input() - providing empty input for non-interactive execution")
+        elif self._mp_ctx is not None:
+            # Non-interactive scripts can run in a worker forked from the
+            # warm template, skipping interpreter startup entirely
+            result = self._run_python_in_worker(file_path, output_display)
+            if result is not None:
+                return result
 
         # Prepare run command
         run_cmd = [sys.executable, '-u', str(file_path)]  # -u for unbuffered output
@@ -298,7 +562,9 @@ class CompilerManager:
                     stdin=subprocess.PIPE,  # Provide stdin pipe
                     text=True,
                     bufsize=1,
-                    universal_newlines=True
+                    universal_newlines=True,
+                    close_fds=False,  # Keep the posix_spawn fast path
+                    start_new_session=True  # Own process group for clean kill
                 )
 
                 # Close stdin immediately to trigger EOF when input() is called
@@ -313,52 +579,43 @@ class CompilerManager:
                     stderr=subprocess.PIPE,
                     text=True,
                     bufsize=1,
-                    universal_newlines=True
+                    universal_newlines=True,
+                    close_fds=False,  # Keep the posix_spawn fast path
+                    start_new_session=True  # Own process group for clean kill
                 )
 
-            # Read output in real-time
+            # Drain both pipes from a single selector task
             output_lines = []
             error_lines = []
-
-            def read_output(stream, lines_list, is_error=False):
-                for line in iter(stream.readline, ''):
-                    line = line.strip()
-                    if line:
-                        lines_list.append(line)
-                        if output_display:
-                            if is_error:
-                                output_display.show_error(line)
-                            else:
-                                output_display.show_output(line)
-
-            # Start threads to read stdout and stderr
-            stdout_thread = threading.Thread(
-                target=read_output,
-                args=(process.stdout, output_lines, False)
+            drain_future = self._reader_pool.submit(
+                self._drain_streams, process, output_lines, error_lines, output_display
             )
-            stderr_thread = threading.Thread(
-                target=read_output,
-                args=(process.stderr, error_lines, True)
-            )
-
-            stdout_thread.daemon = True
-            stderr_thread.daemon = True
-            stdout_thread.start()
-            stderr_thread.start()
 
-            # Wait for process to complete with timeout
+            # Poll on a short tick instead of a blocking wait(timeout=10):
+            # the common fast-exit case returns almost immediately, and a
+            # timeout kills the whole process group so grandchildren
+            # spawned by the user's script don't outlive it
+            deadline = time.monotonic() + 10  # 10 second timeout
+            while True:
+                return_code = process.poll()
+                if return_code is not None:
+                    break
+                if time.monotonic() > deadline:
+                    self._kill_process_group(process)
+                    return {
+                        'success': False,
+                        'error': 'Program execution timed out (10 seconds)'
+                    }
+                time.sleep(0.02)
+
+            # Wait for the drain task to finish flushing output. Only a
+            # late flush is tolerated here; a drain that actually failed
+            # re-raises so the error surfaces instead of the run quietly
+            # producing no output
             try:
-                return_code = process.wait(timeout=10)  # 10 second timeout
-            except subprocess.TimeoutExpired:
-                process.kill()
-                return {
-                    'success': False,
-                    'error': 'Program execution timed out (10 seconds)'
-                }
-
-            # Wait for output threads to complete
-            stdout_thread.join(timeout=1.0)
-            stderr_thread.join(timeout=1.0)
+                drain_future.result(timeout=1.0)
+            except FutureTimeoutError:
+                pass
 
             if return_code == 0:
                 return {
@@ -388,6 +645,146 @@ class CompilerManager:
                 'error': f'Execution error: {str(e)}'
             }
 
+    def _kill_process_group(self, process):
+        """Kill a timed-out child and every process in its group"""
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (AttributeError, OSError):
+            process.kill()  # No process groups (e.g. Windows)
+
+    def _drain_one(self, stream, lines, show):
+        """Drain a single pipe line by line"""
+        for line in stream:
+            line = line.strip()
+            if line:
+                lines.append(line)
+                if show:
+                    show(line)
+
+    def _drain_streams(self, process, output_lines, error_lines, output_display):
+        """Drain stdout and stderr of a process from one selector loop
+
+        Multiplexing both pipes on a single reader halves the thread
+        count per run and keeps stdout/stderr lines in arrival order.
+        The loop reads raw chunks straight off the fds and splits lines
+        in Python: selector readiness only guarantees a single byte, so
+        a blocking readline() here could deadlock against a child that
+        wrote a partial line on one pipe and then filled the other, and
+        reading through the buffered wrappers would leave buffered lines
+        invisible to select. Windows selectors only handle sockets, not
+        anonymous pipes, so there the pipes are drained by a pair of
+        readers instead.
+        """
+        if os.name == 'nt':
+            stderr_future = self._reader_pool.submit(
+                self._drain_one, process.stderr, error_lines,
+                output_display.show_error if output_display else None
+            )
+            self._drain_one(process.stdout, output_lines,
+                            output_display.show_output if output_display else None)
+            stderr_future.result()
+            return
+
+        def emit(line, is_error):
+            line = line.strip()
+            if line:
+                (error_lines if is_error else output_lines).append(line)
+                if output_display:
+                    if is_error:
+                        output_display.show_error(line)
+                    else:
+                        output_display.show_output(line)
+
+        sel = selectors.DefaultSelector()
+        partials = {}
+        decoders = {}
+        for stream, is_error in ((process.stdout, False), (process.stderr, True)):
+            fd = stream.fileno()
+            sel.register(fd, selectors.EVENT_READ, is_error)
+            partials[fd] = ''
+            decoders[fd] = codecs.getincrementaldecoder('utf-8')('replace')
+
+        try:
+            while sel.get_map():
+                for key, _ in sel.select(timeout=0.1):
+                    fd, is_error = key.fd, key.data
+                    chunk = os.read(fd, 4096)
+                    if not chunk:
+                        sel.unregister(fd)
+                        # Flush a trailing line that never got its newline
+                        if partials[fd]:
+                            emit(partials[fd], is_error)
+                        continue
+                    data = partials[fd] + decoders[fd].decode(chunk)
+                    lines = data.split('\n')
+                    partials[fd] = lines.pop()
+                    for line in lines:
+                        emit(line, is_error)
+        finally:
+            sel.close()
+
+    def _run_python_in_worker(self, file_path: Path, output_display) -> Optional[Dict[str, Any]]:
+        """Run a Python script in a process forked from the warm template
+
+        Returns None if the worker machinery fails for any reason, in
+        which case the caller falls back to the plain subprocess path.
+        """
+        try:
+            parent_conn, child_conn = self._mp_ctx.Pipe(duplex=False)
+            process = self._mp_ctx.Process(
+                target=_run_script_child,
+                args=(str(file_path), child_conn),
+                daemon=True
+            )
+            process.start()
+            child_conn.close()
+
+            # Wait for the result with the same timeout as subprocess
+            # runs; kill the worker's whole process group so children
+            # spawned by the script (or a SIGTERM-catching script) don't
+            # survive the timeout
+            if not parent_conn.poll(10):
+                self._kill_process_group(process)
+                return {
+                    'success': False,
+                    'error': 'Program execution timed out (10 seconds)'
+                }
+
+            return_code, out, err = parent_conn.recv()
+            process.join(timeout=1.0)
+
+            output_lines = [line.strip() for line in out.splitlines() if line.strip()]
+            error_lines = [line.strip() for line in err.splitlines() if line.strip()]
+
+            if output_display:
+                # One multi-line chunk per stream; the display splits it
+                # into lines itself, so this costs two queue handoffs
+                # instead of one per line
+                if output_lines:
+                    output_display.show_output('\n'.join(output_lines))
+                if error_lines:
+                    output_display.show_error('\n'.join(error_lines))
+
+            if return_code == 0:
+                return {
+                    'success': True,
+                    'output': '\n'.join(output_lines),
+                    'error_output': '\n'.join(error_lines)
+                }
+            else:
+                error_msg = f"Command failed with return code {return_code}"
+                if error_lines:
+                    error_msg += f"\nError output: {' '.join(error_lines)}"
+                return {
+                    'success': False,
+                    'error': error_msg,
+                    'output': '\n'.join(output_lines),
+                    'error_output': '\n'.join(error_lines)
+                }
+
+        except Exception:
+            return None  # Fall back to running via subprocess
+
     def _execute_command(self, cmd: list, working_dir: Path, output_display) -> Dict[str, Any]:
         """Execute a command and capture output"""
         try:
@@ -399,45 +796,40 @@ class CompilerManager:
                 stderr=subprocess.PIPE,
                 text=True,
                 bufsize=1,
-                universal_newlines=True
-            )
-
-            # Read output in real-time
-            output_lines = []
-            error_lines = []
-
-            def read_output(stream, lines_list, is_error=False):
-                for line in iter(stream.readline, ''):
-                    line = line.strip()
-                    if line:
-                        lines_list.append(line)
-                        if output_display:
-                            if is_error:
-                                output_display.show_error(line)
-                            else:
-                                output_display.show_output(line)
-
-            # Start threads to read stdout and stderr
-            stdout_thread = threading.Thread(
-                target=read_output,
-                args=(process.stdout, output_lines, False)
-            )
-            stderr_thread = threading.Thread(
-                target=read_output,
-                args=(process.stderr, error_lines, True)
+                universal_newlines=True,
+                close_fds=False  # Keep the posix_spawn fast path
             )
 
-            stdout_thread.daemon = True
-            stderr_thread.daemon = True
-            stdout_thread.start()
-            stderr_thread.start()
+            if output_display is None:
+                # No one is watching output in real time, so drain both
+                # pipes with a single buffered communicate() call instead
+                # of line-by-line reader threads. No timeout here: this
+                # branch serves compiles (spawn, compile_batch), which
+                # may legitimately take longer than a run, and the
+                # baseline waited indefinitely
+                out, err = process.communicate()
+                output_lines = [line.strip() for line in out.splitlines() if line.strip()]
+                error_lines = [line.strip() for line in err.splitlines() if line.strip()]
+                return_code = process.returncode
+            else:
+                # Drain both pipes from a single selector task, streaming
+                # lines to the display as they arrive
+                output_lines = []
+                error_lines = []
+                drain_future = self._reader_pool.submit(
+                    self._drain_streams, process, output_lines, error_lines, output_display
+                )
 
-            # Wait for process to complete
-            return_code = process.wait()
+                # Wait for process to complete
+                return_code = process.wait()
 
-            # Wait for output threads to complete
-            stdout_thread.join(timeout=1.0)
-            stderr_thread.join(timeout=1.0)
+                # Wait for the drain task to finish flushing output;
+                # tolerate a late flush but let real drain failures
+                # propagate into the error return below
+                try:
+                    drain_future.result(timeout=1.0)
+                except FutureTimeoutError:
+                    pass
 
             if return_code == 0:
                 return {
@@ -7,14 +7,98 @@ import tkinter as tk
 from tkinter import ttk
 from pygments import lex
 from pygments.lexers import get_lexer_by_name, guess_lexer
-from pygments.token import Token
+from pygments.token import Token, Keyword, String, Comment, Number, Name, Operator
 from pygments.styles import get_style_by_name
 import re
+from bisect import bisect_right
+from collections import defaultdict
+
+
+# Shared sub-patterns for the hand-written lexers below
+_C_STYLE_COMMENT = r'//[^\n]*|(?s:/\*.*?\*/)'
+_DQ_STRING = r'"(?:\\.|[^"\\\n])*"'
+_SQ_STRING = r"'(?:\\.|[^'\\\n])*'"
+_PY_TRIPLE_STRING = (r'(?s:"""(?:\\.|[^\\])*?"""|'
+                     r"'''(?:\\.|[^\\])*?''')")
+
+
+def _compile_fast_lexer(keywords, comment, string):
+    """Build a single-pass highlighting regex with named tag groups"""
+    return re.compile(
+        '(?P<comment>' + comment + ')'
+        '|(?P<string>' + string + ')'
+        r'|(?P<keyword>\b(?:' + keywords + r')\b)'
+        r'|(?P<number>\b\d+(?:\.\d+)?\b)'
+        r'|(?P<function>\b[A-Za-z_]\w*(?=\s*\())'
+    )
 
 
 class CodeEditor(ctk.CTkFrame):
     """Enhanced code editor with syntax highlighting"""
 
+    # Shared cache of constructed Pygments lexers, keyed by lexer name,
+    # so re-highlights don't pay registry lookup + lexer init every time
+    _LEXER_CACHE = {}
+
+    # Hand-written single-pass lexers for the five supported languages:
+    # one compiled regex per language whose named groups map directly to
+    # our tag names. The re module runs as a C state machine, which beats
+    # Pygments' generic pure-Python lexer by a wide margin on the small
+    # buffers a keystroke re-highlight touches. Pygments remains the
+    # fallback for any language not listed here.
+    _FAST_LEXERS = {
+        'python': _compile_fast_lexer(
+            keywords=('False|None|True|and|as|assert|async|await|break|'
+                      'class|continue|def|del|elif|else|except|finally|for|'
+                      'from|global|if|import|in|is|lambda|nonlocal|not|or|'
+                      'pass|raise|return|try|while|with|yield'),
+            comment=r'#[^\n]*',
+            string=_PY_TRIPLE_STRING + '|' + _DQ_STRING + '|' + _SQ_STRING,
+        ),
+        'c': _compile_fast_lexer(
+            keywords=('auto|break|case|char|const|continue|default|do|'
+                      'double|else|enum|extern|float|for|goto|if|int|long|'
+                      'register|return|short|signed|sizeof|static|struct|'
+                      'switch|typedef|union|unsigned|void|volatile|while'),
+            comment=_C_STYLE_COMMENT,
+            string=_DQ_STRING + '|' + _SQ_STRING,
+        ),
+        'cpp': _compile_fast_lexer(
+            keywords=('auto|bool|break|case|catch|char|class|const|'
+                      'constexpr|continue|default|delete|do|double|else|'
+                      'enum|explicit|extern|false|float|for|friend|goto|if|'
+                      'inline|int|long|namespace|new|nullptr|operator|'
+                      'private|protected|public|register|return|short|'
+                      'signed|sizeof|static|struct|switch|template|this|'
+                      'throw|true|try|typedef|typename|union|unsigned|'
+                      'using|virtual|void|volatile|while'),
+            comment=_C_STYLE_COMMENT,
+            string=_DQ_STRING + '|' + _SQ_STRING,
+        ),
+        'java': _compile_fast_lexer(
+            keywords=('abstract|boolean|break|byte|case|catch|char|class|'
+                      'const|continue|default|do|double|else|enum|extends|'
+                      'false|final|finally|float|for|goto|if|implements|'
+                      'import|instanceof|int|interface|long|native|new|'
+                      'null|package|private|protected|public|return|short|'
+                      'static|strictfp|super|switch|synchronized|this|'
+                      'throw|throws|transient|true|try|void|volatile|while'),
+            comment=_C_STYLE_COMMENT,
+            string=_DQ_STRING + '|' + _SQ_STRING,
+        ),
+        'javascript': _compile_fast_lexer(
+            keywords=('async|await|break|case|catch|class|const|continue|'
+                      'debugger|default|delete|do|else|export|extends|'
+                      'false|finally|for|from|function|if|import|in|'
+                      'instanceof|let|new|null|of|return|super|switch|'
+                      'this|throw|true|try|typeof|undefined|var|void|'
+                      'while|with|yield'),
+            comment=_C_STYLE_COMMENT,
+            string=(_DQ_STRING + '|' + _SQ_STRING +
+                    r'|(?s:`(?:\\.|[^`\\])*`)'),
+        ),
+    }
+
     def __init__(self, parent, language="python", **kwargs):
         super().__init__(parent, **kwargs)
 
@@ -31,6 +115,19 @@ class CodeEditor(ctk.CTkFrame):
         self._setup_scrollbars()
         self._setup_bindings()
 
+        # Monotonic counter used to cancel in-flight highlighting when a
+        # newer edit supersedes it
+        self._highlight_seq = 0
+
+        # Cached Tcl round-trip results: the line count holds until the
+        # next edit, the cursor index until the event loop goes idle
+        self._line_count_cache = None
+        self._cursor_index_cache = None
+
+        # Line count as of the last highlighting pass, used to spot
+        # edits that added or removed lines (paste, multi-line delete)
+        self._last_line_count = 1
+
         # Initialize syntax highlighting
         self.update_syntax_highlighting()
 
@@ -109,13 +206,68 @@ class CodeEditor(ctk.CTkFrame):
         self.text.tag_remove("sel", "1.0", "end")
         return "break"
 
+    # Line content that can open or close a construct spanning lines;
+    # editing such a line requires a full re-highlight
+    _MULTILINE_MARKERS = re.compile(r'"""|\'\'\'|/\*|\*/|\\$')
+
     def _on_text_change(self, event=None):
         """Handle text changes and update syntax highlighting"""
+        # Invalidate any highlighting pass still in flight
+        self._highlight_seq += 1
+
+        # The buffer shape may have changed
+        self._line_count_cache = None
+
         # Debounce the syntax highlighting to avoid performance issues
         if hasattr(self, '_highlight_timer'):
             self.after_cancel(self._highlight_timer)
 
-        self._highlight_timer = self.after(300, self.update_syntax_highlighting)
+        self._highlight_timer = self.after(300, self._highlight_current_line)
+
+    def _highlight_current_line(self):
+        """Re-highlight only the edited line instead of the whole buffer"""
+        if not self.language or self.language not in self.language_configs:
+            return
+
+        # A paste or deletion spanning lines touches more than the cursor
+        # line; a changed line count is the cheap tell, and those edits
+        # need a full re-highlight
+        line_count = self.get_line_count()
+        if line_count != self._last_line_count:
+            self._last_line_count = line_count
+            self.update_syntax_highlighting()
+            return
+
+        start = self.text.index("insert linestart")
+        end = self.text.index("insert lineend")
+        line_text = self.text.get(start, end)
+
+        # Fall back to a full re-highlight when the edit may affect other
+        # lines: the line opens/closes a multi-line construct, or it is
+        # currently highlighted as part of one (string/comment state
+        # carried over from a previous line)
+        if (self._MULTILINE_MARKERS.search(line_text) or
+                'string' in self.text.tag_names(start) or
+                'comment' in self.text.tag_names(start)):
+            self.update_syntax_highlighting()
+            return
+
+        try:
+            lexer_name = self.language_configs[self.language]['lexer']
+            lexer = self._LEXER_CACHE.get(lexer_name)
+            if lexer is None:
+                lexer = self._LEXER_CACHE.setdefault(
+                    lexer_name, get_lexer_by_name(lexer_name, stripnl=False)
+                )
+
+            # Clear and re-apply highlighting for just this line
+            self._clear_highlighting(start, end)
+            self._apply_syntax_highlighting(line_text, lexer, base=start,
+                                            seq=self._highlight_seq)
+
+        except Exception as e:
+            # If syntax highlighting fails, continue without it
+            print(f"Syntax highlighting error: {e}")
 
     def set_language(self, language):
         """Set the programming language for syntax highlighting"""
@@ -129,9 +281,13 @@ class CodeEditor(ctk.CTkFrame):
             return
 
         try:
-            # Get the lexer for the current language
+            # Get the lexer for the current language (cached across calls)
             lexer_name = self.language_configs[self.language]['lexer']
-            lexer = get_lexer_by_name(lexer_name)
+            lexer = self._LEXER_CACHE.get(lexer_name)
+            if lexer is None:
+                lexer = self._LEXER_CACHE.setdefault(
+                    lexer_name, get_lexer_by_name(lexer_name, stripnl=False)
+                )
 
             # Get current text content
             content = self.text.get("1.0", "end")
@@ -140,78 +296,110 @@ class CodeEditor(ctk.CTkFrame):
             self._clear_highlighting()
 
             # Apply syntax highlighting
-            self._apply_syntax_highlighting(content, lexer)
+            self._apply_syntax_highlighting(content, lexer,
+                                            seq=self._highlight_seq)
 
         except Exception as e:
             # If syntax highlighting fails, continue without it
             print(f"Syntax highlighting error: {e}")
 
-    def _clear_highlighting(self):
-        """Clear all syntax highlighting"""
+    def _clear_highlighting(self, start="1.0", end="end"):
+        """Clear syntax highlighting in the given range (whole buffer by default)"""
         # Remove all token tags
         for tag in ['keyword', 'string', 'comment', 'number', 'function', 'class', 'operator', 'variable']:
-            self.text.tag_remove(tag, "1.0", "end")
+            self.text.tag_remove(tag, start, end)
 
-    def _apply_syntax_highlighting(self, content, lexer):
-        """Apply syntax highlighting to the text"""
+    def _apply_syntax_highlighting(self, content, lexer, base="1.0", seq=None):
+        """Apply syntax highlighting to the text starting at the given index"""
         try:
-            # Tokenize the content
-            tokens = list(lex(content, lexer))
-
-            # Apply highlighting based on tokens
-            current_pos = "1.0"
-            for token_type, token_value in tokens:
-                if token_value.strip():  # Skip empty tokens
-                    # Map pygments token types to our tag names
-                    tag = self._map_token_to_tag(token_type)
-                    if tag:
-                        # Find the end position
-                        lines = token_value.split('\n')
-                        if len(lines) == 1:
-                            # Single line token
-                            end_pos = self.text.index(f"{current_pos} + {len(token_value)} chars")
-                            self.text.tag_add(tag, current_pos, end_pos)
-                            current_pos = end_pos
-                        else:
-                            # Multi-line token
-                            for i, line in enumerate(lines):
-                                if i == 0:
-                                    # First line
-                                    end_pos = self.text.index(f"{current_pos} lineend")
-                                    self.text.tag_add(tag, current_pos, end_pos)
-                                    current_pos = self.text.index(f"{current_pos} + 1 line linestart")
-                                elif i == len(lines) - 1:
-                                    # Last line
-                                    self.text.tag_add(tag, current_pos, f"{current_pos} + {len(line)} chars")
-                                else:
-                                    # Middle lines
-                                    end_pos = self.text.index(f"{current_pos} lineend")
-                                    self.text.tag_add(tag, current_pos, end_pos)
-                                    current_pos = self.text.index(f"{current_pos} + 1 line linestart")
+            # Precompute cumulative character offsets of each line start so
+            # token positions translate to Tk indices with pure arithmetic
+            # instead of a text.index() Tcl round-trip per token
+            line_offsets = [0]
+            acc = 0
+            for line in content.splitlines(keepends=True):
+                acc += len(line)
+                line_offsets.append(acc)
+
+            # Base index is always a line start ("1.0" or "N.0")
+            base_line = int(base.split('.')[0])
+
+            # Collect (start, end) ranges per tag so each tag needs only
+            # one tag_add call instead of one Tcl round-trip per token
+            ranges = defaultdict(list)
+
+            fast_lexer = self._FAST_LEXERS.get(self.language)
+            if fast_lexer is not None:
+                # Fast path: one regex pass, match group name == tag name
+                for count, match in enumerate(fast_lexer.finditer(content)):
+                    # Bail out if a newer highlighting request superseded us
+                    if seq is not None and count % 256 == 0 and seq != self._highlight_seq:
+                        return
+
+                    pos, end = match.span()
+                    start_line = bisect_right(line_offsets, pos) - 1
+                    end_line = bisect_right(line_offsets, end) - 1
+                    ranges[match.lastgroup].extend((
+                        f"{base_line + start_line}.{pos - line_offsets[start_line]}",
+                        f"{base_line + end_line}.{end - line_offsets[end_line]}"
+                    ))
+            else:
+                # Fallback: apply highlighting based on Pygments tokens,
+                # consuming the lexer generator directly instead of
+                # materializing a token list
+                pos = 0
+                for count, (token_type, token_value) in enumerate(lex(content, lexer)):
+                    # Bail out if a newer highlighting request superseded us
+                    if seq is not None and count % 256 == 0 and seq != self._highlight_seq:
+                        return
+
+                    end = pos + len(token_value)
+                    # Skip empty/whitespace tokens without allocating a
+                    # stripped copy of every token value
+                    if token_value and not token_value.isspace():
+                        # Map pygments token types to our tag names
+                        tag = self._map_token_to_tag(token_type)
+                        if tag:
+                            start_line = bisect_right(line_offsets, pos) - 1
+                            end_line = bisect_right(line_offsets, end) - 1
+                            ranges[tag].extend((
+                                f"{base_line + start_line}.{pos - line_offsets[start_line]}",
+                                f"{base_line + end_line}.{end - line_offsets[end_line]}"
+                            ))
+                    pos = end
+
+            # Flush all ranges with one tag_add per tag (Tk accepts
+            # alternating start/end index pairs as varargs)
+            for tag, args in ranges.items():
+                self.text.tag_add(tag, *args)
 
         except Exception as e:
             print(f"Error applying syntax highlighting: {e}")
 
+    # Pygments token singletons mapped to our tag names; more specific
+    # entries (Name.Function, Name.Class) win over their parents via the
+    # hierarchy walk in _map_token_to_tag
+    _TOKEN_MAP = {
+        Keyword: 'keyword',
+        String: 'string',
+        Comment: 'comment',
+        Number: 'number',
+        Name.Function: 'function',
+        Name.Class: 'class',
+        Operator: 'operator',
+        Name: 'variable',
+    }
+
     def _map_token_to_tag(self, token_type):
         """Map pygments token types to our tag names"""
-        token_str = str(token_type)
-
-        if 'Keyword' in token_str:
-            return 'keyword'
-        elif 'String' in token_str:
-            return 'string'
-        elif 'Comment' in token_str:
-            return 'comment'
-        elif 'Number' in token_str:
-            return 'number'
-        elif 'Name.Function' in token_str:
-            return 'function'
-        elif 'Name.Class' in token_str:
-            return 'class'
-        elif 'Operator' in token_str:
-            return 'operator'
-        elif 'Name' in token_str:
-            return 'variable'
+        # Walk from the most specific type up its hierarchy and return
+        # the first mapped ancestor - a couple of dict lookups on the
+        # token singletons instead of stringifying the type and running
+        # a chain of substring scans on every token
+        for candidate in reversed(token_type.split()):
+            tag = self._TOKEN_MAP.get(candidate)
+            if tag is not None:
+                return tag
 
         return None
 
@@ -223,11 +411,17 @@ class CodeEditor(ctk.CTkFrame):
         """Set the text content"""
         self.text.delete("1.0", "end")
         self.text.insert("1.0", content)
+        # Programmatic edits never reach the key/button handlers, so the
+        # cached line count has to be dropped here
+        self._line_count_cache = None
         self.update_syntax_highlighting()
+        self._last_line_count = self.get_line_count()
 
     def clear(self):
         """Clear the editor content"""
         self.text.delete("1.0", "end")
+        self._line_count_cache = None
+        self._last_line_count = 1
 
     def undo(self):
         """Undo the last action"""
@@ -257,15 +451,31 @@ class CodeEditor(ctk.CTkFrame):
 
     def get_line_count(self):
         """Get the number of lines in the editor"""
-        return int(self.text.index("end-1c").split(".")[0])
+        if self._line_count_cache is None:
+            self._line_count_cache = int(self.text.index("end-1c").split(".")[0])
+        return self._line_count_cache
+
+    def _cursor_index(self):
+        """Get the cursor's Tk index, cached for the current event"""
+        if self._cursor_index_cache is None:
+            self._cursor_index_cache = self.text.index("insert")
+            # Status-bar callers typically ask for line and column back to
+            # back; share one Tcl round-trip and drop the cache once the
+            # event loop goes idle so the next event sees a fresh value
+            self.after_idle(self._clear_cursor_cache)
+        return self._cursor_index_cache
+
+    def _clear_cursor_cache(self):
+        """Invalidate the cached cursor index"""
+        self._cursor_index_cache = None
 
     def get_current_line(self):
         """Get the current line number"""
-        return int(self.text.index("insert").split(".")[0])
+        return int(self._cursor_index().split(".")[0])
 
     def get_current_column(self):
         """Get the current column number"""
-        return int(self.text.index("insert").split(".")[1])
+        return int(self._cursor_index().split(".")[1])
 
     def goto_line(self, line_number):
         """Go to a specific line"""
@@ -0,0 +1,19 @@
+"""
+Shared font cache for the GUI widgets
+"""
+
+import customtkinter as ctk
+
+# Shared CTkFont instances so each widget doesn't reparse a font tuple
+# into its own font object at construction time
+_FONTS = {}
+
+
+def get_font(family, size, weight="normal"):
+    """Return a shared CTkFont for the given family/size/weight"""
+    key = (family, size, weight)
+    font = _FONTS.get(key)
+    if font is None:
+        font = ctk.CTkFont(family=family, size=size, weight=weight)
+        _FONTS[key] = font
+    return font
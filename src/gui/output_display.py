@@ -5,6 +5,51 @@ Output Display component for showing compilation and execution results
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import ttk
+import codecs
+import queue
+import re
+import threading
+from bisect import bisect_right
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
+
+from gui.fonts import get_font
+
+
+@lru_cache(maxsize=64)
+def _compile_search_pattern(terms):
+    """Compile one case-insensitive regex matching any of the terms
+
+    Cached so repeated searches for the same terms (e.g. re-running after
+    new output arrives) skip both escaping and compilation.
+    """
+    return re.compile("|".join(map(re.escape, terms)), re.IGNORECASE)
+
+
+class _TextPeer(tk.Text):
+    """Tk Text peer sharing another Text widget's underlying buffer
+
+    A peer is a second view onto the same B-tree, so the text is stored
+    once and inserts and tag changes on either widget show up in both.
+    Tkinter has no constructor for peers, so this registers the widget
+    path created by "text peer create" by hand instead of going through
+    Widget.__init__.
+    """
+
+    _serial = 0
+
+    def __init__(self, master, source, cnf={}, **kw):
+        _TextPeer._serial += 1
+        name = f"peer{_TextPeer._serial}"
+        self._name = name
+        self._w = (f".{name}" if str(master) == "."
+                   else f"{master._w}.{name}")
+        self.children = {}
+        self.master = master
+        self.tk = master.tk
+        source.peer_create(self._w, cnf, **kw)
+        master.children[name] = self
 
 
 class OutputDisplay(ctk.CTkFrame):
@@ -17,40 +62,102 @@ class OutputDisplay(ctk.CTkFrame):
         self._setup_scrollbars()
         self._setup_buttons()
 
+        # Appends are queued and coalesced into one insert per same-tag
+        # run on the next idle tick, instead of one Tcl call per line
+        self._pending = deque()
+        self._flush_scheduled = False
+        self._is_empty = True
+
+        # Virtualized backing store: the full log lives in plain Python
+        # lists and the Text widget only ever holds a fixed-size viewport
+        # of it, so widget cost stays bounded however much output piles up
+        self._lines = []
+        self._line_tags = []
+        self._view_start = 0
+        self._view_size = 2000
+        self._following_tail = True
+        self._max_lines = None
+        self._max_lines_slack = 128
+
+        # Search hits are kept as (line, col) offsets and only the ones
+        # inside the visible region are tagged; the rest are tagged
+        # lazily as the view moves
+        self._search_hits = []
+        self._rehighlight_scheduled = False
+        self.text.bind("<Configure>", self._schedule_rehighlight)
+
+        # File saves run on a worker thread; results come back through a
+        # queue polled on the Tk main thread, which owns all widget calls
+        self._io_queue = queue.Queue()
+        self.after(50, self._poll_io)
+
+        # Attached subprocess pipes are read by daemon threads in big
+        # chunks and handed over through a thread-safe queue; a 16ms
+        # poll moves them into the batched flush path on the main thread
+        self._stream_queue = queue.Queue()
+        self._stream_count = 0
+        self._stream_poll_scheduled = False
+
     def _setup_display(self):
         """Set up the output text display"""
         # Create text widget for output
         self.text = tk.Text(
             self,
             wrap="word",
-            font=("Consolas", 10),
+            font=get_font("Consolas", 10),
             bg="#1e1e1e",  # Dark theme background
             fg="#d4d4d4",  # Light text
-            state="disabled",
             height=8
         )
 
+        # The widget stays in normal state permanently so appends don't
+        # pay two state flips per call; user edits are blocked via key
+        # binds instead
+        self.text.bind("<Key>", self._block_edit)
+        self.text.bind("<<Paste>>", lambda e: "break")
+        self.text.bind("<<Cut>>", lambda e: "break")
+
         # Configure tags for different types of output
         self.text.tag_configure("output", foreground="#d4d4d4")
         self.text.tag_configure("error", foreground="#f44747")  # Red for errors
         self.text.tag_configure("warning", foreground="#ffcc02")  # Yellow for warnings
         self.text.tag_configure("info", foreground="#4ec9b0")  # Teal for info
         self.text.tag_configure("success", foreground="#6a9955")  # Green for success
+        self.text.tag_configure("search", background="#264f78")  # Search matches
+
+    _NAV_KEYSYMS = frozenset((
+        "Left", "Right", "Up", "Down", "Prior", "Next", "Home", "End",
+        "Control_L", "Control_R", "Shift_L", "Shift_R",
+    ))
+
+    def _block_edit(self, event):
+        """Swallow edit keys while letting navigation and Ctrl-C through"""
+        if event.keysym in self._NAV_KEYSYMS:
+            return None
+        if event.state & 0x4 and event.keysym.lower() == "c":
+            return None
+        return "break"
 
     def _setup_scrollbars(self):
         """Set up scrollbars for the output display"""
-        # Vertical scrollbar
-        self.v_scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.text.yview)
-        self.text.configure(yscrollcommand=self.v_scrollbar.set)
+        # Vertical scrollbar goes through a proxy that maps positions in
+        # the full backing store into the viewport held by the widget
+        self.v_scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_v_scroll)
+        self.text.configure(yscrollcommand=self._on_text_yscroll)
 
-        # Horizontal scrollbar
-        self.h_scrollbar = ttk.Scrollbar(self, orient="horizontal", command=self.text.xview)
-        self.text.configure(xscrollcommand=self.h_scrollbar.set)
+        # Wheel scrolling has to use the same mapping, otherwise it would
+        # stall at the edges of the viewport
+        self.text.bind("<MouseWheel>", self._on_mousewheel)
+        self.text.bind("<Button-4>", self._on_mousewheel)
+        self.text.bind("<Button-5>", self._on_mousewheel)
+
+        # No horizontal scrollbar: the widget word-wraps, so horizontal
+        # scrolling never fires and the extra xview callback per insert
+        # and grid row were pure overhead
 
         # Grid layout
         self.text.grid(row=0, column=0, sticky="nsew")
         self.v_scrollbar.grid(row=0, column=1, sticky="ns")
-        self.h_scrollbar.grid(row=1, column=0, sticky="ew")
 
         # Configure grid weights
         self.grid_rowconfigure(0, weight=1)
@@ -60,7 +167,7 @@ class OutputDisplay(ctk.CTkFrame):
         """Set up control buttons for the output display"""
         # Button frame
         self.button_frame = ctk.CTkFrame(self, fg_color="transparent")
-        self.button_frame.grid(row=2, column=0, columnspan=2, sticky="ew", pady=(5, 0))
+        self.button_frame.grid(row=1, column=0, columnspan=2, sticky="ew", pady=(5, 0))
 
         # Clear button
         self.clear_btn = ctk.CTkButton(
@@ -105,58 +212,284 @@ class OutputDisplay(ctk.CTkFrame):
         """Show success text"""
         self._append_text(text, "success")
 
+    def attach_stream(self, fileobj, tag="output"):
+        """Stream a file-like object (e.g. a subprocess pipe) into the display
+
+        A daemon thread reads the pipe in 4 KB chunks off the Tk thread,
+        so chatty processes cost a few queue handoffs instead of one Tk
+        event per stdout line.
+        """
+        self._stream_count += 1
+        if not self._stream_poll_scheduled:
+            self._stream_poll_scheduled = True
+            self.after(16, self._drain_stream_queue)
+        threading.Thread(
+            target=self._read_stream, args=(fileobj, tag), daemon=True
+        ).start()
+
+    def _read_stream(self, fileobj, tag):
+        """Read a pipe to EOF on a worker thread
+
+        A line (or a multi-byte character) can straddle a 4 KB chunk
+        boundary, so the trailing partial line is held back and prepended
+        to the next chunk instead of being rendered as a line of its own.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        partial = ""
+        try:
+            while True:
+                chunk = fileobj.read(4096)
+                if not chunk:
+                    break
+                if isinstance(chunk, bytes):
+                    chunk = decoder.decode(chunk)
+                    if not chunk:
+                        continue
+                chunk = partial + chunk
+                cut = chunk.rfind("\n") + 1
+                if not cut:
+                    partial = chunk
+                    continue
+                partial = chunk[cut:]
+                self._stream_queue.put((chunk[:cut], tag))
+        finally:
+            if partial:
+                self._stream_queue.put((partial, tag))
+            # Sentinel so the poll knows this stream is done
+            self._stream_queue.put((None, tag))
+
+    def _drain_stream_queue(self):
+        """Move queued pipe chunks into the batched flush path"""
+        try:
+            while True:
+                chunk, tag = self._stream_queue.get_nowait()
+                if chunk is None:
+                    self._stream_count -= 1
+                else:
+                    self._pending.append((chunk, tag))
+        except queue.Empty:
+            pass
+
+        # Already on the main thread inside a frame tick, so flush
+        # directly instead of scheduling another event
+        if self._pending and not self._flush_scheduled:
+            self._flush_pending()
+
+        # Keep polling only while streams are still open
+        if self._stream_count > 0 or not self._stream_queue.empty():
+            self.after(16, self._drain_stream_queue)
+        else:
+            self._stream_poll_scheduled = False
+
     def _append_text(self, text, tag="output"):
-        """Append text to the output display"""
-        # Enable text widget for editing
-        self.text.configure(state="normal")
+        """Queue text for appending to the output display"""
+        self._pending.append((text + "\n", tag))
+
+        # Flush on a 16ms frame tick rather than after_idle: under a
+        # steady stream, idle callbacks fire once per event-loop turn
+        # and barely coalesce, while a frame tick guarantees one widget
+        # update per frame however fast lines arrive
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after(16, self._flush_pending)
+
+    def _flush_pending(self):
+        """Flush queued appends into the backing store and viewport"""
+        self._flush_scheduled = False
+        if not self._pending:
+            return
 
         # Add timestamp if this is the first text or after a clear
-        if self.text.get("1.0", "end").strip() == "":
-            import datetime
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-            self.text.insert("end", f"[{timestamp}] ", "info")
-
-        # Insert the text with appropriate tag
-        self.text.insert("end", text + "\n", tag)
-
-        # Scroll to the end
-        self.text.see("end")
+        if self._is_empty:
+            timestamp = datetime.now().strftime("%H:%M:%S")
+            self._pending.appendleft((f"[{timestamp}]\n", "info"))
+            self._is_empty = False
+
+        appended = 0
+        pending = self._pending
+        while pending:
+            chunk, tag = pending.popleft()
+            for line in chunk.splitlines():
+                self._lines.append(line)
+                self._line_tags.append(tag)
+                appended += 1
+
+        # Evict oldest lines once the store overshoots the limit plus
+        # slack, so trimming costs one bulk del instead of one per line
+        if (self._max_lines is not None and
+                len(self._lines) > self._max_lines + self._max_lines_slack):
+            self._trim_store(len(self._lines) - self._max_lines)
+
+        if self._following_tail:
+            total = len(self._lines)
+            new_start = max(0, total - self._view_size)
+            if appended >= self._view_size:
+                # More new lines than the viewport holds; rewrite it
+                self._view_start = new_start
+                self._render_viewport()
+            else:
+                # Slide the viewport: drop shifted-out lines from the top
+                # of the widget and append only the new lines at the end
+                shift = new_start - self._view_start
+                if shift > 0:
+                    self.text.delete("1.0", f"{shift + 1}.0")
+                    self._view_start = new_start
+                self._insert_lines(total - appended, total)
+                self.text.see("end")
+
+        # When the user has scrolled back, the widget is left alone and
+        # only the scrollbar proportions change
+        self._update_scrollbar()
+
+    def _trim_store(self, drop):
+        """Drop the oldest lines and rebase everything indexed against them
+
+        Search hits are stored as backing-store offsets, so they have to
+        shift with the store; hits that pointed into the dropped lines
+        are discarded. When the trim reaches into the rendered slice the
+        overlapping lines leave the widget too, otherwise the widget
+        would keep trimmed lines forever and drift out of sync with the
+        store it is supposed to mirror.
+        """
+        overlap = drop - self._view_start
+        if overlap > 0:
+            self.text.delete("1.0", f"{overlap + 1}.0")
+        del self._lines[:drop]
+        del self._line_tags[:drop]
+        self._view_start = max(0, self._view_start - drop)
+        if self._search_hits:
+            self._search_hits = [
+                (sl - drop, sc, el - drop, ec)
+                for sl, sc, el, ec in self._search_hits
+                if sl >= drop
+            ]
+            self._schedule_rehighlight()
+
+    def _insert_lines(self, start, end):
+        """Insert backing-store lines [start, end) at the end of the widget
+
+        Consecutive same-tag lines are merged into a single insert call.
+        """
+        lines, tags = self._lines, self._line_tags
+        i = start
+        while i < end:
+            tag = tags[i]
+            j = i + 1
+            while j < end and tags[j] == tag:
+                j += 1
+            self.text.insert("end", "\n".join(lines[i:j]) + "\n", tag)
+            i = j
+
+    def _render_viewport(self):
+        """Rewrite the widget with the lines currently in the viewport"""
+        self.text.delete("1.0", "end")
+        self._insert_lines(self._view_start,
+                           min(len(self._lines), self._view_start + self._view_size))
+        if self._following_tail:
+            self.text.see("end")
 
-        # Disable text widget again
-        self.text.configure(state="disabled")
+    def _held_lines(self):
+        """Number of backing-store lines currently held by the widget"""
+        return min(len(self._lines) - self._view_start, self._view_size)
+
+    def _global_top(self):
+        """Backing-store index of the first visible line"""
+        return self._view_start + int(float(self.text.yview()[0]) * self._held_lines())
+
+    def _visible_span(self):
+        """Number of lines visible in the widget right now"""
+        first, last = self.text.yview()
+        return max(1, int((float(last) - float(first)) * self._held_lines()))
+
+    def _scroll_to(self, target):
+        """Scroll so that backing-store line target is at the top"""
+        total = len(self._lines)
+        target = max(0, min(target, total - 1))
+
+        # Center the viewport on the target so the widget has scroll
+        # headroom in both directions before the next re-render
+        new_start = max(0, min(target - self._view_size // 2,
+                               total - self._view_size))
+        self._following_tail = target >= total - self._visible_span()
+        if new_start != self._view_start:
+            self._view_start = new_start
+            self._render_viewport()
+        held = max(self._held_lines(), 1)
+        self.text.yview_moveto((target - self._view_start) / held)
+        self._update_scrollbar()
+
+    def _on_v_scroll(self, *args):
+        """Scrollbar proxy mapping global positions into the viewport"""
+        total = len(self._lines)
+        if total <= self._view_size:
+            self.text.yview(*args)
+            return
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * total))
+        elif args[0] == "scroll":
+            amount, unit = int(args[1]), args[2]
+            if unit == "pages":
+                amount *= max(1, self._visible_span() - 2)
+            self._scroll_to(self._global_top() + amount)
+
+    def _on_text_yscroll(self, first, last):
+        """Report the widget's view as a fraction of the full log"""
+        total = len(self._lines)
+        if total <= self._view_size:
+            self.v_scrollbar.set(first, last)
+            self._schedule_rehighlight()
+            return
+        held = self._held_lines()
+        first, last = float(first), float(last)
+        self.v_scrollbar.set((self._view_start + first * held) / total,
+                             (self._view_start + last * held) / total)
+        self._schedule_rehighlight()
+
+    def _update_scrollbar(self):
+        """Refresh the scrollbar from the widget's current view"""
+        self._on_text_yscroll(*self.text.yview())
+
+    def _on_mousewheel(self, event):
+        """Route wheel scrolling through the viewport mapping"""
+        if len(self._lines) <= self._view_size:
+            return None
+        if getattr(event, "delta", 0):
+            step = -3 if event.delta > 0 else 3
+        else:
+            step = -3 if event.num == 4 else 3
+        self._scroll_to(self._global_top() + step)
+        return "break"
 
     def clear(self):
         """Clear all output"""
-        self.text.configure(state="normal")
+        self._pending.clear()
+        self._is_empty = True
+        self._lines = []
+        self._line_tags = []
+        self._view_start = 0
+        self._following_tail = True
+        self._search_hits = []
         self.text.delete("1.0", "end")
-        self.text.configure(state="disabled")
 
     def copy_output(self):
         """Copy output to clipboard"""
         try:
-            # Enable text widget temporarily
-            self.text.configure(state="normal")
-
-            # Get selected text or all text if nothing is selected
-            try:
-                selected_text = self.text.get("sel.first", "sel.last")
-            except tk.TclError:
-                # No selection, get all text
-                selected_text = self.text.get("1.0", "end-1c")
-
-            # Copy to clipboard
-            self.clipboard_clear()
-            self.clipboard_append(selected_text)
-
-            # Disable text widget again
-            self.text.configure(state="disabled")
+            if self.text.tag_ranges("sel"):
+                # Let Tk copy the selection natively, without pulling the
+                # text into Python first
+                self.text.event_generate("<<Copy>>")
+            else:
+                # No selection, copy the full log rather than just the
+                # slice rendered in the widget
+                self.clipboard_clear()
+                self.clipboard_append(self.get_output_text())
 
         except Exception as e:
             print(f"Error copying to clipboard: {e}")
 
     def get_output_text(self):
-        """Get all output text"""
-        return self.text.get("1.0", "end-1c")
+        """Get all output text from the backing store"""
+        return "\n".join(self._lines)
 
     def save_output(self, filename=None):
         """Save output to a file"""
@@ -168,83 +501,189 @@ class OutputDisplay(ctk.CTkFrame):
             )
 
         if filename:
-            try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(self.get_output_text())
-                self.show_info(f"Output saved to {filename}")
-            except Exception as e:
-                self.show_error(f"Error saving output: {str(e)}")
-
-    def set_max_lines(self, max_lines):
-        """Set maximum number of lines to keep in the display"""
-        self.text.configure(state="normal")
+            # Snapshot the text on the main thread, then let a worker do
+            # the blocking write so huge outputs don't freeze the GUI
+            data = self.get_output_text()
+            threading.Thread(
+                target=self._do_save, args=(filename, data), daemon=True
+            ).start()
+
+    def _do_save(self, filename, data):
+        """Write output to a file on a worker thread"""
+        try:
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write(data)
+            self._io_queue.put(("ok", f"Output saved to {filename}"))
+        except Exception as e:
+            self._io_queue.put(("err", f"Error saving output: {str(e)}"))
 
-        # Count current lines
-        current_lines = int(self.text.index("end-1c").split(".")[0])
+    def _poll_io(self):
+        """Drain completed background I/O results on the main thread"""
+        try:
+            while True:
+                status, message = self._io_queue.get_nowait()
+                if status == "ok":
+                    self.show_info(message)
+                else:
+                    self.show_error(message)
+        except queue.Empty:
+            pass
+        self.after(50, self._poll_io)
 
-        if current_lines > max_lines:
-            # Remove lines from the beginning
-            lines_to_remove = current_lines - max_lines
-            self.text.delete("1.0", f"{lines_to_remove + 1}.0")
+    def set_max_lines(self, max_lines):
+        """Set maximum number of lines to keep in the backing store"""
+        self._max_lines = max_lines
 
-        self.text.configure(state="disabled")
+        # Trim immediately if the store is already over the new limit
+        if len(self._lines) > max_lines:
+            self._trim_store(len(self._lines) - max_lines)
+            self._render_viewport()
 
     def auto_scroll(self, enabled=True):
         """Enable or disable auto-scrolling to bottom"""
+        self._following_tail = enabled
         if enabled:
+            total = len(self._lines)
+            new_start = max(0, total - self._view_size)
+            if new_start != self._view_start:
+                self._view_start = new_start
+                self._render_viewport()
             self.text.see("end")
-        # Note: This is called automatically when new text is added
 
     def highlight_line(self, line_number, tag="warning"):
         """Highlight a specific line"""
+        self.highlight_lines([line_number], tag)
+
+    def highlight_lines(self, line_numbers, tag="warning"):
+        """Highlight several lines with a single tag_add call
+
+        Tk accepts variadic index pairs, so a batch of diagnostics costs
+        one Tcl round-trip instead of one per line. Line numbers are
+        1-based positions in the full log (matching get_line_count);
+        they are mapped into the viewport, and lines that fall outside
+        the slice held by the widget are skipped.
+        """
+        if not line_numbers or not self._lines:
+            return
         try:
-            start_idx = f"{line_number}.0"
-            end_idx = f"{line_number}.end"
-
-            self.text.configure(state="normal")
-            self.text.tag_add(tag, start_idx, end_idx)
-            self.text.configure(state="disabled")
-
-            # Scroll to the highlighted line
-            self.text.see(start_idx)
+            # Bring the first requested line into view first, since that
+            # may slide the viewport
+            self._scroll_to(line_numbers[0] - 1)
+
+            view_start = self._view_start
+            held = self._held_lines()
+            args = []
+            for line_number in line_numbers:
+                widget_line = line_number - view_start
+                if 1 <= widget_line <= held:
+                    args += [f"{widget_line}.0", f"{widget_line}.end"]
+            if args:
+                self.text.tag_add(tag, *args)
 
         except tk.TclError:
             pass  # Invalid line number
 
     def get_line_count(self):
-        """Get the number of lines in the output"""
-        return int(self.text.index("end-1c").split(".")[0])
-
-    def search_output(self, search_term):
-        """Search for text in the output"""
-        self.text.configure(state="normal")
-
-        # Clear previous search highlights
-        self.text.tag_remove("search", "1.0", "end")
-
-        # Configure search tag
-        self.text.tag_configure("search", background="#264f78")
+        """Get the number of lines in the output
 
-        # Search for the term
-        count = 0
-        start_pos = "1.0"
+        Reads the backing store length instead of asking Tcl to walk the
+        widget's B-tree and parsing the index string.
+        """
+        return len(self._lines)
 
-        while True:
-            start_pos = self.text.search(search_term, start_pos, "end", nocase=True)
-            if not start_pos:
-                break
+    def search_output(self, search_terms):
+        """Search for one or more terms in the output
 
-            end_pos = f"{start_pos} + {len(search_term)} chars"
-            self.text.tag_add("search", start_pos, end_pos)
+        Accepts a single string or a list of strings. All terms are
+        combined into one compiled regex and matched in a single linear
+        pass over the buffer, instead of repeated text.search round-trips
+        that each rescan from the match position.
+        """
+        if isinstance(search_terms, str):
+            search_terms = [search_terms]
 
-            start_pos = end_pos
-            count += 1
+        # Clear previous search highlights
+        self.text.tag_remove("search", "1.0", "end")
 
-        self.text.configure(state="disabled")
-        return count
+        terms = [term for term in search_terms if term]
+        if not terms:
+            self._search_hits = []
+            return 0
+
+        pattern = _compile_search_pattern(tuple(terms))
+
+        # Match over the full backing store once and keep the hits as
+        # line/column offsets; only the visible ones are actually tagged
+        buf = self.get_output_text()
+        line_offsets = [0]
+        acc = 0
+        for line in buf.splitlines(keepends=True):
+            acc += len(line)
+            line_offsets.append(acc)
+
+        hits = []
+        for match in pattern.finditer(buf):
+            start, end = match.span()
+            start_line = bisect_right(line_offsets, start) - 1
+            end_line = bisect_right(line_offsets, end) - 1
+            hits.append((start_line, start - line_offsets[start_line],
+                         end_line, end - line_offsets[end_line]))
+
+        self._search_hits = hits
+        self._highlight_visible_hits()
+        return len(hits)
+
+    def _highlight_visible_hits(self):
+        """Tag only the search hits inside the visible region"""
+        self.text.tag_remove("search", "1.0", "end")
+        if not self._search_hits:
+            return
+
+        top = self._global_top()
+        bottom = top + self._visible_span() + 1
+        view_start = self._view_start
+
+        indices = []
+        for start_line, start_col, end_line, end_col in self._search_hits:
+            if end_line < top or start_line > bottom:
+                continue
+            indices.extend((
+                f"{start_line - view_start + 1}.{start_col}",
+                f"{end_line - view_start + 1}.{end_col}"
+            ))
+
+        if indices:
+            self.text.tag_add("search", *indices)
+
+    def _schedule_rehighlight(self, event=None):
+        """Debounce re-tagging of visible search hits after view changes"""
+        if self._search_hits and not self._rehighlight_scheduled:
+            self._rehighlight_scheduled = True
+            self.after_idle(self._rehighlight_visible)
+
+    def _rehighlight_visible(self):
+        self._rehighlight_scheduled = False
+        self._highlight_visible_hits()
+
+    def create_peer(self, parent, **kwargs):
+        """Create a read-only peer view of the output in another parent
+
+        The peer shares this display's text buffer, so showing the output
+        in a second pane costs no second copy and needs no double
+        inserts; callers attach their own scrollbars to the returned
+        widget.
+        """
+        kwargs.setdefault("wrap", "word")
+        kwargs.setdefault("font", get_font("Consolas", 10))
+        kwargs.setdefault("bg", "#1e1e1e")
+        kwargs.setdefault("fg", "#d4d4d4")
+        peer = _TextPeer(parent, self.text, **kwargs)
+        peer.bind("<Key>", self._block_edit)
+        peer.bind("<<Paste>>", lambda e: "break")
+        peer.bind("<<Cut>>", lambda e: "break")
+        return peer
 
     def clear_search_highlights(self):
         """Clear search highlights"""
-        self.text.configure(state="normal")
+        self._search_hits = []
         self.text.tag_remove("search", "1.0", "end")
-        self.text.configure(state="disabled")
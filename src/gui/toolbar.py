@@ -4,6 +4,20 @@ Toolbar component for the UMLC application
 
 import customtkinter as ctk
 import tkinter as tk
+import time
+
+from gui.fonts import get_font
+
+# Display-name <-> language-code maps, built once instead of per call
+_LANG_TO_CODE = {
+    "Python": "python",
+    "C": "c",
+    "C++": "cpp",
+    "Java": "java",
+    "JavaScript": "javascript"
+}
+_CODE_TO_LANG = {code: name for name, code in _LANG_TO_CODE.items()}
+_LANG_DISPLAY = tuple(_LANG_TO_CODE)
 
 
 class Toolbar(ctk.CTkFrame):
@@ -15,6 +29,25 @@ class Toolbar(ctk.CTkFrame):
         self.main_app = main_app
         self.current_language = "python"
 
+        # Only the language dropdown and execution controls are built up
+        # front; the file buttons and status labels are created lazily on
+        # first use to keep the startup widget tree small
+        self._file_frame_built = False
+        self._status_frame_built = False
+
+        # Status-label updates fire on every cursor move; they are
+        # coalesced so a burst of calls costs one configure at idle time
+        self._pos_pending = None
+        self._pos_scheduled = False
+        self._file_pending = None
+        self._file_scheduled = False
+
+        # Status messages expire against a rolling deadline checked by
+        # one heartbeat timer instead of an after_cancel/after pair per
+        # message
+        self._status_deadline = 0
+        self.after(200, self._status_tick)
+
         self._setup_toolbar()
 
     def _setup_toolbar(self):
@@ -26,7 +59,7 @@ class Toolbar(ctk.CTkFrame):
         self.language_label = ctk.CTkLabel(
             self.language_frame,
             text="Language:",
-            font=("Arial", 12, "bold")
+            font=get_font("Arial", 12, "bold")
         )
         self.language_label.pack(side="left", padx=(0, 10))
 
@@ -35,7 +68,7 @@ class Toolbar(ctk.CTkFrame):
         self.language_dropdown = ctk.CTkOptionMenu(
             self.language_frame,
             variable=self.language_var,
-            values=["Python", "C", "C++", "Java", "JavaScript"],
+            values=list(_LANG_DISPLAY),
             command=self._on_language_change,
             width=100
         )
@@ -52,7 +85,7 @@ class Toolbar(ctk.CTkFrame):
             command=self._run_code,
             width=100,
             height=35,
-            font=("Arial", 11)
+            font=get_font("Arial", 11)
         )
         self.run_btn.pack(side="left", padx=(0, 5))
 
@@ -63,10 +96,24 @@ class Toolbar(ctk.CTkFrame):
             command=self._compile_code,
             width=110,
             height=35,
-            font=("Arial", 11)
+            font=get_font("Arial", 11)
         )
         self.compile_btn.pack(side="left", padx=(0, 5))
 
+        # File and status widgets are deferred past first paint; F5/F6
+        # already work through the main window's key bindings in the
+        # meantime. The status frame must be scheduled too - nothing
+        # calls the update methods on a fresh start, so it would
+        # otherwise never appear
+        self.after_idle(self._ensure_file_frame)
+        self.after_idle(self._ensure_status_frame)
+
+    def _ensure_file_frame(self):
+        """Build the file-operation buttons on first use"""
+        if self._file_frame_built:
+            return
+        self._file_frame_built = True
+
         # File operations
         self.file_frame = ctk.CTkFrame(self, fg_color="transparent")
         self.file_frame.pack(side="left", padx=(0, 10))
@@ -78,7 +125,7 @@ class Toolbar(ctk.CTkFrame):
             command=self._new_file,
             width=80,
             height=35,
-            font=("Arial", 11)
+            font=get_font("Arial", 11)
         )
         self.new_btn.pack(side="left", padx=(0, 5))
 
@@ -89,7 +136,7 @@ class Toolbar(ctk.CTkFrame):
             command=self._open_file,
             width=80,
             height=35,
-            font=("Arial", 11)
+            font=get_font("Arial", 11)
         )
         self.open_btn.pack(side="left", padx=(0, 5))
 
@@ -100,10 +147,16 @@ class Toolbar(ctk.CTkFrame):
             command=self._save_file,
             width=80,
             height=35,
-            font=("Arial", 11)
+            font=get_font("Arial", 11)
         )
         self.save_btn.pack(side="left")
 
+    def _ensure_status_frame(self):
+        """Build the status labels on first use"""
+        if self._status_frame_built:
+            return
+        self._status_frame_built = True
+
         # Status and info
         self.status_frame = ctk.CTkFrame(self, fg_color="transparent")
         self.status_frame.pack(side="right", padx=(10, 10))
@@ -112,7 +165,7 @@ class Toolbar(ctk.CTkFrame):
         self.file_label = ctk.CTkLabel(
             self.status_frame,
             text="No file open",
-            font=("Arial", 10),
+            font=get_font("Arial", 10),
             text_color="gray"
         )
         self.file_label.pack(side="left")
@@ -121,7 +174,7 @@ class Toolbar(ctk.CTkFrame):
         self.position_label = ctk.CTkLabel(
             self.status_frame,
             text="Ln 1, Col 1",
-            font=("Arial", 10),
+            font=get_font("Arial", 10),
             text_color="gray"
         )
         self.position_label.pack(side="left", padx=(10, 0))
@@ -130,48 +183,48 @@ class Toolbar(ctk.CTkFrame):
         self.lang_indicator = ctk.CTkLabel(
             self.status_frame,
             text="Python",
-            font=("Arial", 10, "bold"),
+            font=get_font("Arial", 10, "bold"),
             text_color="#4ec9b0"
         )
         self.lang_indicator.pack(side="left", padx=(10, 0))
 
     def _on_language_change(self, selected_language):
         """Handle language selection change"""
-        language_map = {
-            "Python": "python",
-            "C": "c",
-            "C++": "cpp",
-            "Java": "java",
-            "JavaScript": "javascript"
-        }
-
-        new_language = language_map.get(selected_language, "python")
+        new_language = _LANG_TO_CODE.get(selected_language, "python")
 
         if new_language != self.current_language:
             self.current_language = new_language
             self.main_app.set_language(new_language)
 
-            # Update language indicator
-            self.lang_indicator.configure(text=selected_language)
+            # Update language indicator; CTk configure rebuilds widget
+            # state even for no-op values, so skip it when unchanged
+            self._ensure_status_frame()
+            if self.lang_indicator.cget("text") != selected_language:
+                self.lang_indicator.configure(text=selected_language)
 
     def update_language(self, language):
         """Update the current language display"""
         self.current_language = language
 
-        language_map_reverse = {
-            "python": "Python",
-            "c": "C",
-            "cpp": "C++",
-            "java": "Java",
-            "javascript": "JavaScript"
-        }
-
-        display_name = language_map_reverse.get(language, "Python")
-        self.language_var.set(display_name)
-        self.lang_indicator.configure(text=display_name)
+        display_name = _CODE_TO_LANG.get(language, "Python")
+        if self.language_var.get() != display_name:
+            self.language_var.set(display_name)
+        self._ensure_status_frame()
+        if self.lang_indicator.cget("text") != display_name:
+            self.lang_indicator.configure(text=display_name)
 
     def update_file_info(self, file_path=None):
         """Update the current file information"""
+        self._file_pending = file_path
+        if not self._file_scheduled:
+            self._file_scheduled = True
+            self.after_idle(self._apply_file_info)
+
+    def _apply_file_info(self):
+        """Apply the most recent file info at idle time"""
+        self._file_scheduled = False
+        self._ensure_status_frame()
+        file_path = self._file_pending
         if file_path:
             import os
             file_name = os.path.basename(file_path)
@@ -181,6 +234,16 @@ class Toolbar(ctk.CTkFrame):
 
     def update_position(self, line=1, column=1):
         """Update the cursor position display"""
+        self._pos_pending = (line, column)
+        if not self._pos_scheduled:
+            self._pos_scheduled = True
+            self.after_idle(self._apply_pos)
+
+    def _apply_pos(self):
+        """Apply the most recent cursor position at idle time"""
+        self._pos_scheduled = False
+        self._ensure_status_frame()
+        line, column = self._pos_pending
         self.position_label.configure(text=f"Ln {line}, Col {column}")
 
     def _run_code(self):
@@ -215,23 +278,30 @@ class Toolbar(ctk.CTkFrame):
 
     def show_status_message(self, message, duration=3000):
         """Show a temporary status message"""
+        self._ensure_status_frame()
+
         # Create a temporary status label if it doesn't exist
         if not hasattr(self, '_status_label'):
             self._status_label = ctk.CTkLabel(
                 self.status_frame,
                 text="",
-                font=("Arial", 9),
+                font=get_font("Arial", 9),
                 text_color="#ffcc02"
             )
             self._status_label.pack(side="left", padx=(15, 0))
 
         self._status_label.configure(text=message)
 
-        # Clear the message after the specified duration
-        if hasattr(self, '_status_timer'):
-            self.after_cancel(self._status_timer)
+        # The heartbeat clears the message once the deadline passes
+        self._status_deadline = time.monotonic() + duration / 1000
 
-        self._status_timer = self.after(duration, lambda: self._status_label.configure(text=""))
+    def _status_tick(self):
+        """Clear an expired status message and reschedule the heartbeat"""
+        if (hasattr(self, '_status_label') and
+                time.monotonic() >= self._status_deadline and
+                self._status_label.cget("text")):
+            self._status_label.configure(text="")
+        self.after(200, self._status_tick)
 
     def get_current_language(self):
         """Get the currently selected language"""
@@ -5,19 +5,59 @@ Built with CustomTkinter for cross-platform compatibility
 
 import customtkinter as ctk
 import tkinter as tk
-from tkinter import filedialog, messagebox
+import asyncio
 import os
+import re
 import sys
+import threading
+from functools import cached_property, partial
 from pathlib import Path
 
 # Add the src directory to Python path
 sys.path.append(str(Path(__file__).parent))
 
-from backend.compiler_manager import CompilerManager
 from gui.code_editor import CodeEditor
 from gui.output_display import OutputDisplay
 from gui.toolbar import Toolbar
 
+# Extension <-> language maps, built once instead of per call
+_EXT_TO_LANG = {
+    '.py': 'python',
+    '.c': 'c',
+    '.cpp': 'cpp',
+    '.cxx': 'cpp',
+    '.java': 'java',
+    '.js': 'javascript'
+}
+_LANG_TO_EXT = {
+    'python': '.py',
+    'c': '.c',
+    'cpp': '.cpp',
+    'java': '.java',
+    'javascript': '.js'
+}
+
+# First input( call on any non-comment line, matched in one pass
+_INPUT_RE = re.compile(r'(?m)^(?P<prefix>(?!\s*#)[^\n]*?)\binput\(')
+
+# File-dialog type filters, built once instead of per dialog
+_OPEN_FILETYPES = (
+    ("Python files", "*.py"),
+    ("C files", "*.c"),
+    ("C++ files", "*.cpp *.cxx"),
+    ("Java files", "*.java"),
+    ("JavaScript files", "*.js"),
+    ("All files", "*.*")
+)
+_SAVE_FILETYPES = (
+    ("Python files", "*.py"),
+    ("C files", "*.c"),
+    ("C++ files", "*.cpp"),
+    ("Java files", "*.java"),
+    ("JavaScript files", "*.js"),
+    ("All files", "*.*")
+)
+
 
 class InputDialog(ctk.CTkToplevel):
     """Dialog for collecting user input for Python programs"""
@@ -60,8 +100,10 @@ class InputDialog(ctk.CTkToplevel):
             wrap="word"
         )
 
-        # Insert placeholder text
+        # Insert placeholder text; tracked with a flag so clearing it
+        # never has to read the buffer back
         self.text_area.insert("1.0", "Enter your input here...\nEach line will be used for one input() call.")
+        self._placeholder_active = True
 
         # Buttons frame
         self.button_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -96,23 +138,36 @@ class InputDialog(ctk.CTkToplevel):
         self.ok_button.pack(side="right", padx=(10, 0))
         self.cancel_button.pack(side="right")
 
-        # Bind events
-        self.text_area.bind("<KeyRelease>", self._on_text_change)
+        # Bind events; the input value is read once on OK, so no
+        # per-keystroke copy of the whole textbox is needed. The
+        # placeholder also has to clear on the first keystroke, not just
+        # on click - the dialog focuses the textbox itself, so typing
+        # straight away is a normal path
         self.text_area.bind("<Button-1>", self._clear_placeholder)
+        self.text_area.bind("<Key>", self._on_first_key)
 
     def _clear_placeholder(self, event=None):
         """Clear placeholder text when user clicks"""
-        if self.text_area.get("1.0", "end-1c") == "Enter your input here...\nEach line will be used for one input() call.":
+        if self._placeholder_active:
+            self._placeholder_active = False
             self.text_area.delete("1.0", "end")
             self.text_area.configure(text_color="white")
 
-    def _on_text_change(self, event=None):
-        """Handle text changes"""
-        self.user_input = self.text_area.get("1.0", "end-1c")
+    def _on_first_key(self, event):
+        """Clear the placeholder before the first typed character lands"""
+        # Modifier and navigation keys have no character; leave the
+        # placeholder up for those
+        if self._placeholder_active and event.char:
+            self._clear_placeholder()
 
     def _on_ok(self):
         """Handle OK button click"""
-        self.user_input = self.text_area.get("1.0", "end-1c")
+        # Single authoritative read of the buffer; if the placeholder
+        # was never cleared the user typed nothing, so skip even that
+        if self._placeholder_active:
+            self.user_input = ""
+        else:
+            self.user_input = self.text_area.get("1.0", "end-1c")
         self.destroy()
 
     def _on_cancel(self):
@@ -123,16 +178,28 @@ class InputDialog(ctk.CTkToplevel):
     def get_input(self):
         """Get the user input"""
         return self.user_input
+
+
+class UMLCApp(ctk.CTk):
     """Main application window for UMLC"""
 
     def __init__(self):
         super().__init__()
 
         # Initialize core components
-        self.compiler_manager = CompilerManager()
         self.current_file = None
         self.current_language = "python"
 
+        # Temp directory for run artifacts, resolved once; Path.home()
+        # hits the environment and passwd database on every call
+        self._temp_dir = Path.home() / ".umlctemp"
+        self._temp_dir.mkdir(exist_ok=True)
+
+        # Background asyncio loop: compiles and runs execute off the Tk
+        # thread so the GUI stays responsive while a build is in flight
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+
         # Configure window
         self.title("Universal Multi-Language Compiler (UMLC)")
         self.geometry("1200x800")
@@ -143,6 +210,16 @@ class InputDialog(ctk.CTkToplevel):
         self._setup_menu()
         self._bind_events()
 
+    @cached_property
+    def compiler_manager(self):
+        """Backend manager, created on first compile/run
+
+        Importing and constructing it lazily keeps window startup (and
+        imports of this module) free of dependency probing.
+        """
+        from backend.compiler_manager import CompilerManager
+        return CompilerManager()
+
     def _setup_layout(self):
         """Set up the main layout of the application"""
         # Create main container
@@ -199,11 +276,10 @@ class InputDialog(ctk.CTkToplevel):
 
         # Language menu
         language_menu = tk.Menu(self.menu_bar, tearoff=0)
-        language_menu.add_command(label="Python", command=lambda: self.set_language("python"))
-        language_menu.add_command(label="C", command=lambda: self.set_language("c"))
-        language_menu.add_command(label="C++", command=lambda: self.set_language("cpp"))
-        language_menu.add_command(label="Java", command=lambda: self.set_language("java"))
-        language_menu.add_command(label="JavaScript", command=lambda: self.set_language("javascript"))
+        for label, language in (("Python", "python"), ("C", "c"), ("C++", "cpp"),
+                                ("Java", "java"), ("JavaScript", "javascript")):
+            language_menu.add_command(label=label,
+                                      command=partial(self.set_language, language))
         self.menu_bar.add_cascade(label="Language", menu=language_menu)
 
         # Run menu
@@ -219,14 +295,20 @@ class InputDialog(ctk.CTkToplevel):
 
         self.config(menu=self.menu_bar)
 
+    # Keyboard accelerators mapped to handler names, bound in one loop
+    _ACCEL_TABLE = (
+        ("<Control-n>", "new_file"),
+        ("<Control-o>", "open_file"),
+        ("<Control-s>", "save_file"),
+        ("<Control-Shift-S>", "save_file_as"),
+        ("<F5>", "run_code"),
+        ("<F6>", "compile_only"),
+    )
+
     def _bind_events(self):
         """Bind keyboard events"""
-        self.bind("<Control-n>", lambda e: self.new_file())
-        self.bind("<Control-o>", lambda e: self.open_file())
-        self.bind("<Control-s>", lambda e: self.save_file())
-        self.bind("<Control-Shift-S>", lambda e: self.save_file_as())
-        self.bind("<F5>", lambda e: self.run_code())
-        self.bind("<F6>", lambda e: self.compile_only())
+        for accel, name in self._ACCEL_TABLE:
+            self.bind(accel, lambda e, handler=getattr(self, name): handler())
 
     def new_file(self):
         """Create a new file"""
@@ -240,16 +322,10 @@ class InputDialog(ctk.CTkToplevel):
         if not self._check_save_changes():
             return
 
+        from tkinter import filedialog
         file_path = filedialog.askopenfilename(
             defaultextension=".py",
-            filetypes=[
-                ("Python files", "*.py"),
-                ("C files", "*.c"),
-                ("C++ files", "*.cpp *.cxx"),
-                ("Java files", "*.java"),
-                ("JavaScript files", "*.js"),
-                ("All files", "*.*")
-            ]
+            filetypes=_OPEN_FILETYPES
         )
 
         if file_path:
@@ -264,16 +340,10 @@ class InputDialog(ctk.CTkToplevel):
 
     def save_file_as(self):
         """Save the current file with a new name"""
+        from tkinter import filedialog
         file_path = filedialog.asksaveasfilename(
             defaultextension=".py",
-            filetypes=[
-                ("Python files", "*.py"),
-                ("C files", "*.c"),
-                ("C++ files", "*.cpp"),
-                ("Java files", "*.java"),
-                ("JavaScript files", "*.js"),
-                ("All files", "*.*")
-            ]
+            filetypes=_SAVE_FILETYPES
         )
 
         if file_path:
@@ -287,28 +357,21 @@ class InputDialog(ctk.CTkToplevel):
 
     def _load_file(self, file_path):
         """Load a file into the editor"""
+        from tkinter import messagebox
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
+            # One Path object gives the content, name and suffix without
+            # re-parsing the path string per query
+            path = Path(file_path)
+            content = path.read_text(encoding='utf-8', errors='replace')
 
             self.code_editor.set_content(content)
             self.current_file = file_path
 
             # Update window title
-            file_name = os.path.basename(file_path)
-            self.title(f"Universal Multi-Language Compiler (UMLC) - {file_name}")
+            self.title(f"Universal Multi-Language Compiler (UMLC) - {path.name}")
 
             # Detect language from file extension
-            ext = os.path.splitext(file_path)[1].lower()
-            language_map = {
-                '.py': 'python',
-                '.c': 'c',
-                '.cpp': 'cpp',
-                '.cxx': 'cpp',
-                '.java': 'java',
-                '.js': 'javascript'
-            }
-            self.current_language = language_map.get(ext, 'python')
+            self.current_language = _EXT_TO_LANG.get(path.suffix.lower(), 'python')
             self.set_language(self.current_language)
 
         except Exception as e:
@@ -316,6 +379,7 @@ class InputDialog(ctk.CTkToplevel):
 
     def _save_to_file(self, file_path):
         """Save content to a file"""
+        from tkinter import messagebox
         try:
             content = self.code_editor.get_content()
             with open(file_path, 'w', encoding='utf-8') as file:
@@ -340,23 +404,27 @@ class InputDialog(ctk.CTkToplevel):
 
     def run_code(self):
         """Run the current code"""
-        if not self.code_editor.get_content().strip():
+        # Fetch the buffer once; every get_content call marshals the
+        # whole document out of Tk
+        content = self.code_editor.get_content()
+        if not content.strip():
+            from tkinter import messagebox
             messagebox.showwarning("Warning", "No code to run!")
             return
 
         try:
             # Check if this is Python code with input()
-            if self.current_language == 'python' and 'input(' in self.code_editor.get_content():
+            if self.current_language == 'python' and 'input(' in content:
                 # For Python code with input, show input dialog first
-                self._run_python_with_input()
+                self._run_python_with_input(content)
             else:
                 # For other cases, use normal execution
-                self._run_code_normal()
+                self._run_code_normal(content)
 
         except Exception as e:
             self.output_display.show_error(f"Runtime error: {str(e)}")
 
-    def _run_python_with_input(self):
+    def _run_python_with_input(self, content):
         """Run Python code that requires user input"""
         # Show input dialog
         dialog = InputDialog(self, "Program Input Required",
@@ -366,141 +434,148 @@ class InputDialog(ctk.CTkToplevel):
         if dialog.cancelled:
             return
 
-        user_input = dialog.get_input()
+        self._dispatch(content, dialog.get_input())
+
+    def _run_code_normal(self, content):
+        """Run code normally without special input handling"""
+        self._dispatch(content)
+
+    def _dispatch(self, content, user_input=None):
+        """Write the source to a temp file and run it on the background loop"""
+        if user_input is not None:
+            temp_file = self._create_temp_file_with_input(user_input, content)
+        else:
+            temp_file = self._create_temp_file(content)
 
-        # Save current content to a temporary file with input handling
-        temp_file = self._create_temp_file_with_input(user_input)
         if not temp_file:
             return
 
-        # Run the code using the compiler manager
-        result = self.compiler_manager.run_code(
+        asyncio.run_coroutine_threadsafe(self._run_async(temp_file), self._loop)
+
+    async def _run_async(self, temp_file):
+        """Run code off the Tk thread and marshal errors back to the GUI"""
+        result = await self.compiler_manager.run_code_async(
             temp_file,
             self.current_language,
             self.output_display
         )
 
         if not result["success"]:
-            self.output_display.show_error(result["error"])
-
-    def _run_code_normal(self):
-        """Run code normally without special input handling"""
-        # Save current content to a temporary file
-        temp_file = self._create_temp_file()
-        if not temp_file:
-            return
+            self.after(0, self.output_display.show_error, result["error"])
 
-        # Run the code using the compiler manager
-        result = self.compiler_manager.run_code(
+    async def _compile_async(self, temp_file):
+        """Compile code off the Tk thread and marshal errors back to the GUI"""
+        result = await self.compiler_manager.compile_code_async(
             temp_file,
             self.current_language,
             self.output_display
         )
 
         if not result["success"]:
-            self.output_display.show_error(result["error"])
+            self.after(0, self.output_display.show_error, result["error"])
 
-    def _create_temp_file_with_input(self, user_input):
+    def _create_temp_file_with_input(self, user_input, content):
         """Create a temporary file with user input for Python programs"""
         try:
-            # Create temp directory if it doesn't exist
-            temp_dir = Path.home() / ".umlctemp"
-            temp_dir.mkdir(exist_ok=True)
-
             # Create temp file with appropriate extension
-            ext_map = {
-                'python': '.py',
-                'c': '.c',
-                'cpp': '.cpp',
-                'java': '.java',
-                'javascript': '.js'
-            }
-
-            ext = ext_map.get(self.current_language, '.txt')
-            temp_file = temp_dir / f"temp_{self.current_language}{ext}"
-
-            # Write content to temp file
-            content = self.code_editor.get_content()
+            ext = _LANG_TO_EXT.get(self.current_language, '.txt')
+            temp_file = self._temp_dir / f"temp_{self.current_language}{ext}"
 
             # For Python files with input, create a version that uses the provided input
             if self.current_language == 'python':
                 content = self._create_input_version(content, user_input)
 
-            with open(temp_file, 'w', encoding='utf-8') as file:
-                file.write(content)
+            self._write_source(temp_file, content)
 
             return str(temp_file)
 
         except Exception as e:
+            from tkinter import messagebox
             messagebox.showerror("Error", f"Failed to create temporary file: {str(e)}")
             return None
 
+    def _create_temp_file(self, content):
+        """Create a temporary file with the current editor content"""
+        try:
+            # Create temp file with appropriate extension
+            ext = _LANG_TO_EXT.get(self.current_language, '.txt')
+            temp_file = self._temp_dir / f"temp_{self.current_language}{ext}"
+
+            self._write_source(temp_file, content)
+
+            return str(temp_file)
+
+        except Exception as e:
+            from tkinter import messagebox
+            messagebox.showerror("Error", f"Failed to create temporary file: {str(e)}")
+            return None
+
+    @staticmethod
+    def _write_source(temp_file, content):
+        """Write source text with one encode and one raw write
+
+        Skips the TextIOWrapper encoder/buffer layers, so even large
+        sources cost a single syscall.
+        """
+        data = content.encode('utf-8')
+        fd = os.open(str(temp_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
     def _create_input_version(self, content, user_input):
         """Create a version of Python code that uses provided input instead of input()"""
-        lines = content.split('\n')
-        modified_lines = []
-        input_count = 0
+        # Nothing to rewrite without an input() call
+        if 'input(' not in content:
+            return content
 
         # Split user input by lines
         input_lines = user_input.split('\n') if user_input.strip() else ['']
+        inputs = iter(input_lines)
 
-        for line in lines:
-            if 'input(' in line and not line.strip().startswith('#'):
-                # Replace input() call with our predefined input
-                input_count += 1
-                if input_count <= len(input_lines):
-                    # Use the corresponding input line
-                    input_value = repr(input_lines[input_count - 1])
-                    # Replace the input() call with the predefined value
-                    modified_line = line.replace('input(', f'input({input_value}) # Original: ')
-                    modified_lines.append(modified_line)
-                else:
-                    # No more input available, use empty string
-                    modified_line = line.replace('input(', 'input("") # Original: ')
-                    modified_lines.append(modified_line)
-            else:
-                modified_lines.append(line)
+        # One C-level regex pass over the whole buffer instead of a
+        # Python loop over every line
+        def repl(match):
+            try:
+                input_value = repr(next(inputs))
+            except StopIteration:
+                # No more input available, use empty string
+                input_value = '""'
+            return f"{match.group('prefix')}input({input_value}) # Original: "
 
-        return '\n'.join(modified_lines)
+        return _INPUT_RE.sub(repl, content)
 
     def compile_only(self):
         """Compile the current code without running"""
-        if not self.code_editor.get_content().strip():
+        content = self.code_editor.get_content()
+        if not content.strip():
+            from tkinter import messagebox
             messagebox.showwarning("Warning", "No code to compile!")
             return
 
         try:
             # Save current content to a temporary file
-            temp_file = self._create_temp_file()
+            temp_file = self._create_temp_file(content)
             if not temp_file:
                 return
 
-            # Compile the code using the compiler manager
-            result = self.compiler_manager.compile_code(
-                temp_file,
-                self.current_language,
-                self.output_display
-            )
-
-            if not result["success"]:
-                self.output_display.show_error(result["error"])
+            # Compile the code on the background loop
+            asyncio.run_coroutine_threadsafe(
+                self._compile_async(temp_file), self._loop)
 
         except Exception as e:
             self.output_display.show_error(f"Compilation error: {str(e)}")
 
     def _wrap_python_input(self, content):
         """Wrap Python code containing input() calls with error handling"""
-        lines = content.split('\n')
-        wrapped_lines = []
-        input_found = False
-
-        for line in lines:
-            wrapped_lines.append(line)
-            if 'input(' in line and not line.strip().startswith('#'):
-                input_found = True
+        # One regex pass decides whether any non-comment line calls
+        # input(); the old per-line loop built a list it never used
+        if _INPUT_RE.search(content):
+            # Indent the body with one C-level replace instead of a
+            # split/join round-trip allocating a substring per line
+            body = '    ' + content.replace('\n', '\n    ')
 
-        # If input() calls were found, add the wrapper
-        if input_found:
             # Insert the try-except wrapper at the beginning
             wrapped_content = '''# Auto-generated wrapper for input() handling
 import sys
@@ -509,7 +584,7 @@ import sys
 _original_stdin = sys.stdin
 
 try:
-''' + '\n'.join('    ' + line for line in lines) + '''
+''' + body + '''
 
 except EOFError:
     print("Note: Program contains input() but is running in non-interactive mode.")
@@ -524,6 +599,7 @@ sys.stdin = _original_stdin
 
     def show_about(self):
         """Show the about dialog"""
+        from tkinter import messagebox
         messagebox.showinfo(
             "About UMLC",
             "Universal Multi-Language Compiler (UMLC)\n\n"
@@ -79,14 +79,19 @@ def main():
     passed = 0
     total = len(tests)
 
-    for test in tests:
+    def run_test(test):
         try:
-            if test():
-                passed += 1
-            print()
+            return bool(test())
         except Exception as e:
             print(f"FAIL: Test failed with exception: {e}")
-            print()
+            return False
+
+    # Run the tests one after another: each prints a multi-line report,
+    # and running them concurrently interleaves those lines into an
+    # unreadable mess for a negligible wall-time win
+    for test in tests:
+        if run_test(test):
+            passed += 1
 
     print("=" * 50)
     print(f"Tests passed: {passed}/{total}")